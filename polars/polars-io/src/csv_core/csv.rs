@@ -383,9 +383,10 @@ impl<'a> CoreReader<'a> {
         );
 
         // If the number of threads given by the user is lower than our global thread pool we create
-        // new one.
+        // new one. A single chunk is processed by a single thread of the global pool anyway, so
+        // small files don't pay for a new pool.
         let owned_pool;
-        let pool = if POOL.current_num_threads() != n_threads {
+        let pool = if n_threads > 1 && POOL.current_num_threads() != n_threads {
             owned_pool = Some(
                 ThreadPoolBuilder::new()
                     .num_threads(n_threads)
@@ -99,6 +99,7 @@ from polars.internals.series import (  # flake8: noqa # TODO: remove need for wr
 from polars.internals.whenthen import when
 from polars.io import (
     read_csv,
+    read_csv_many,
     read_ipc,
     read_ipc_schema,
     read_json,
@@ -107,6 +108,7 @@ from polars.io import (
     scan_csv,
     scan_ipc,
     scan_parquet,
+    set_remote_cache,
 )
 from polars.string_cache import StringCache
 
@@ -136,6 +138,7 @@ __all__ = [
     "Categorical",
     # polars.io
     "read_csv",
+    "read_csv_many",
     "read_parquet",
     "read_json",
     "read_sql",
@@ -144,6 +147,7 @@ __all__ = [
     "scan_ipc",
     "scan_parquet",
     "read_ipc_schema",
+    "set_remote_cache",
     # polars.stringcache
     "StringCache",
     # polars.config
@@ -224,6 +224,8 @@ def _pandas_series_to_arrow(
     Returns
     -------
     """
+    import pyarrow.compute as pa_compute
+
     dtype = values.dtype
     if dtype == "datetime64[ns]":
         # We first cast to ms because that's the unit of Datetime,
@@ -232,8 +234,8 @@ def _pandas_series_to_arrow(
         arr = pa.array(
             np.array(values.values, dtype="datetime64[ms]"), from_pandas=nan_to_none
         )
-        arr = pa.compute.cast(arr, pa.int64())
-        return pa.compute.cast(arr, pa.timestamp("ms"))
+        arr = pa_compute.cast(arr, pa.int64())
+        return pa_compute.cast(arr, pa.timestamp("ms"))
     elif dtype == "object" and len(values) > 0:
         if isinstance(values.values[0], str):
             return pa.array(values, pa.large_utf8(), from_pandas=nan_to_none)
@@ -490,6 +492,8 @@ def pandas_to_pydf(
 
 
 def coerce_arrow(array: "pa.Array", rechunk: bool = True) -> "pa.Array":
+    import pyarrow.compute as pa_compute
+
     if isinstance(array, pa.TimestampArray) and array.type.tz is not None:
         warnings.warn(
             "Conversion of timezone aware to naive datetimes. TZ information may be lost",
@@ -497,7 +501,7 @@ def coerce_arrow(array: "pa.Array", rechunk: bool = True) -> "pa.Array":
 
     # note: Decimal256 could not be cast to float
     if isinstance(array.type, pa.Decimal128Type):
-        array = pa.compute.cast(array, pa.float64())
+        array = pa_compute.cast(array, pa.float64())
 
     if hasattr(array, "num_chunks") and array.num_chunks > 1 and rechunk:
         # small integer keys can often not be combined, so let's already cast
@@ -509,7 +513,7 @@ def coerce_arrow(array: "pa.Array", rechunk: bool = True) -> "pa.Array":
             or pa.types.is_uint16(array.type.index_type)
             or pa.types.is_int32(array.type.index_type)
         ):
-            array = pa.compute.cast(
+            array = pa_compute.cast(
                 array, pa.dictionary(pa.uint32(), pa.large_string())
             ).combine_chunks()
     return array
@@ -33,8 +33,6 @@ import numpy as np
 
 try:
     import pyarrow as pa
-    import pyarrow.compute
-    import pyarrow.parquet
 
     _PYARROW_AVAILABLE = True
 except ImportError:  # pragma: no cover
@@ -1121,7 +1119,9 @@ class DataFrame:
                 data[name] = column
             tbl = pa.table(data)
 
-            pa.parquet.write_table(
+            import pyarrow.parquet as pa_parquet
+
+            pa_parquet.write_table(
                 table=tbl,
                 where=file,
                 compression=compression,
@@ -1706,6 +1706,14 @@ class DataFrame:
         """
         self._df.set_column_names(columns)
 
+    def _rename_by_index(self, positions: Sequence[int], names: Sequence[str]) -> None:
+        """
+        Rename the columns at ``positions`` to ``names`` in place.
+
+        Unlike setting ``columns``, only the new names are passed to Rust.
+        """
+        self._df.rename_by_index(positions, names)
+
     @property
     def dtypes(self) -> List[Type[DataType]]:
         """
@@ -1,6 +1,12 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache, partial
+from importlib.util import find_spec
 from io import BytesIO, StringIO
 from pathlib import Path
+from threading import Lock
 from typing import (
     Any,
     BinaryIO,
@@ -11,56 +17,345 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Sequence,
     TextIO,
     Tuple,
     Type,
+    TypeVar,
     Union,
     overload,
 )
-from urllib.request import urlopen
+from urllib.request import Request, urlopen
 
 from polars.utils import handle_projection_columns
 
 try:
     import pyarrow as pa
-    import pyarrow.csv
-    import pyarrow.feather
-    import pyarrow.parquet
 
     _PYARROW_AVAILABLE = True
 except ImportError:  # pragma: no cover
     _PYARROW_AVAILABLE = False
 
 from polars.convert import from_arrow
-from polars.datatypes import DataType
-from polars.internals import DataFrame, LazyFrame
+from polars.datatypes import (
+    Categorical,
+    DataType,
+    Float32,
+    Float64,
+    Int32,
+    Int64,
+    UInt32,
+    UInt64,
+    Utf8,
+)
+from polars.internals import DataFrame, LazyFrame, concat
 
 try:
     from polars.polars import ipc_schema as _ipc_schema
 except ImportError:  # pragma: no cover
     pass
 
-try:
-    import connectorx as cx
+# The pyarrow submodules, connectorx and fsspec are only imported on first use, as
+# importing them adds to the import time of polars.
+_WITH_CX = find_spec("connectorx") is not None
+_WITH_FSSPEC = find_spec("fsspec") is not None
 
-    _WITH_CX = True
-except ImportError:
-    _WITH_CX = False
+# Subdirectory of the path given to `set_remote_cache` that holds the cached files.
+_REMOTE_CACHE_SUBDIR = "polars-filecache"
+
+# Local directory and maximum size (in bytes) of the cache for remote files.
+_REMOTE_CACHE: Optional[Tuple[str, int]] = None
+_REMOTE_CACHE_LOCK = Lock()
 
-try:
-    import fsspec
-    from fsspec.utils import infer_storage_options
 
-    _WITH_FSSPEC = True
-except ImportError:
-    _WITH_FSSPEC = False
+T = TypeVar("T")
+
+# Size of the ranges in which large http responses are downloaded.
+_HTTP_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Maximum number of concurrent range requests used to download a http(s) url.
+_HTTP_MAX_RANGE_REQUESTS = 16
+
+
+def _http_range_size(path: str) -> Optional[int]:
+    """
+    Get the size in bytes of a http(s) url, if the server accepts range requests.
+
+    Returns ``None`` if the size is unknown or ranges are not supported.
+    """
+    try:
+        with urlopen(Request(path, method="HEAD")) as f:
+            if f.headers.get("Accept-Ranges") != "bytes":
+                return None
+            return int(f.headers["Content-Length"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _read_http_ranges(path: str, size: int, n_parts: int) -> Optional[BytesIO]:
+    """
+    Download a http(s) url of ``size`` bytes with ``n_parts`` concurrent range requests.
+
+    Every response is read straight into its own slice of a preallocated buffer.
+    Returns ``None`` if the server does not answer a range request with a partial
+    response.
+    """
+    buf = BytesIO()
+    buf.seek(size - 1)
+    buf.write(b"\0")
+    part_size = -(-size // n_parts)
+
+    with buf.getbuffer() as view:
+
+        def read_range(start: int) -> bool:
+            end = min(start + part_size, size)
+            request = Request(path, headers={"Range": f"bytes={start}-{end - 1}"})
+            with urlopen(request) as f:
+                if f.status != 206:
+                    return False
+                part = view[start:end]
+                while part:
+                    n_read = f.readinto(part)
+                    if not n_read:
+                        raise OSError(f"range request to {path} ended early")
+                    part = part[n_read:]
+            return True
+
+        with ThreadPoolExecutor(max_workers=n_parts) as pool:
+            # consume the results to raise errors from the worker threads
+            if not all(list(pool.map(read_range, range(0, size, part_size)))):
+                return None
+
+    buf.seek(0)
+    return buf
 
 
 def _process_http_file(path: str) -> BytesIO:
+    """
+    Download a http(s) url into a `BytesIO`.
+
+    If the server reports the size and accepts range requests, urls larger than a
+    block are downloaded with concurrent range requests, one per block up to
+    ``_HTTP_MAX_RANGE_REQUESTS``. Otherwise, or if the server ignores the ranges,
+    the response is read at once.
+    """
+    size = _http_range_size(path)
+    if size is not None:
+        n_parts = min(_HTTP_MAX_RANGE_REQUESTS, size // _HTTP_BLOCK_SIZE)
+        if n_parts > 1:
+            buf = _read_http_ranges(path, size, n_parts)
+            if buf is not None:
+                return buf
+
     with urlopen(path) as f:
         return BytesIO(f.read())
 
 
+# Matches the scheme of an url, e.g. "s3://" or "https://".
+_URL_SCHEME = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*://")
+
+
+def _protocol_of(file: str) -> str:
+    """
+    Get the fsspec protocol of ``file``, e.g. "file" for a local path.
+
+    Local paths are recognized without calling into fsspec. For urls only the scheme
+    is passed to fsspec, and the result is cached per scheme.
+    """
+    scheme = _URL_SCHEME.match(file)
+    if scheme is None:
+        return "file"
+    return _protocol_of_scheme(scheme.group())
+
+
+@lru_cache(maxsize=32)
+def _protocol_of_scheme(scheme: str) -> str:
+    from fsspec.utils import infer_storage_options
+
+    return infer_storage_options(f"{scheme}x")["protocol"]
+
+
+def set_remote_cache(
+    path: Optional[Union[str, Path]], max_bytes: int = 1024 * 1024 * 1024
+) -> None:
+    """
+    Cache remote files on local disk.
+
+    Once set, remote files read with ``read_csv``, ``read_parquet`` and ``read_ipc``
+    are opened through fsspec's ``filecache``, so repeated reads of the same url are
+    served from the local copy. When the cache grows beyond ``max_bytes``, the least
+    recently used files are evicted. Requires ``fsspec``.
+
+    Parameters
+    ----------
+    path
+        Directory to store the cached files in. They are kept in its
+        ``polars-filecache`` subdirectory, and only files in there are evicted.
+        Set to ``None`` to disable the cache.
+    max_bytes
+        Maximum total size of the cached files.
+
+    Examples
+    --------
+
+    >>> pl.set_remote_cache(
+    ...     "~/.cache/polars", max_bytes=10 * 1024**3
+    ... )  # doctest: +SKIP
+    >>> df = pl.read_parquet("s3://bucket/file.parquet")  # doctest: +SKIP
+
+    """
+    global _REMOTE_CACHE
+
+    if path is None:
+        _REMOTE_CACHE = None
+        return
+    if not _WITH_FSSPEC:
+        raise ImportError(
+            "fsspec is not installed. Please run pip install fsspec to cache remote files."
+        )
+
+    cache_dir = os.path.join(os.path.expanduser(str(path)), _REMOTE_CACHE_SUBDIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    _REMOTE_CACHE = (cache_dir, max_bytes)
+    _evict_remote_cache()
+
+
+def _evict_remote_cache() -> None:
+    """
+    Remove the least recently used files until the cache fits in its size limit.
+    """
+    if _REMOTE_CACHE is None:
+        return
+    cache_dir, max_bytes = _REMOTE_CACHE
+
+    with _REMOTE_CACHE_LOCK:
+        cached = []
+        for entry in os.scandir(cache_dir):
+            # "cache" holds the metadata of fsspec's filecache
+            if entry.is_file() and entry.name != "cache":
+                stat = entry.stat()
+                cached.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in cached)
+        for _, size, path in sorted(cached):
+            if total_bytes <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # e.g. on Windows a file that is still open cannot be removed
+                continue
+            total_bytes -= size
+
+
+@contextmanager
+def _open_remote_cached(
+    file: Union[str, List[str]], cache_dir: str, **kwargs: Any
+) -> Iterator[Any]:
+    """
+    Open remote file(s) through fsspec's ``filecache`` stored in ``cache_dir``.
+    """
+    import fsspec
+
+    protocol = _protocol_of(file if isinstance(file, str) else file[0])
+    # with chained urls, the options of the remote filesystem are keyed by protocol
+    options = {protocol: kwargs, "filecache": {"cache_storage": cache_dir}}
+
+    if isinstance(file, str):
+        opened = fsspec.open(f"filecache::{file}", **options)
+    else:
+        opened = fsspec.open_files([f"filecache::{f}" for f in file], **options)
+
+    with opened as f:
+        # mark the local copies as recently used
+        for local_file in f if isinstance(f, list) else [f]:
+            name = getattr(local_file, "name", None)
+            if isinstance(name, str) and os.path.exists(name):
+                os.utime(name)
+        yield f
+    _evict_remote_cache()
+
+
+# Number of characters of a `StringIO` that are encoded at once.
+_ENCODE_CHUNK_SIZE = 1024 * 1024
+
+
+def _encode_stringio(file: StringIO) -> BytesIO:
+    """
+    Encode the remaining text of ``file`` as utf8 into a `BytesIO`.
+
+    The text is encoded in chunks, so no full copy of it is made next to the
+    encoded bytes.
+    """
+    buf = BytesIO()
+    while True:
+        chunk = file.read(_ENCODE_CHUNK_SIZE)
+        if not chunk:
+            break
+        buf.write(chunk.encode("utf8"))
+    buf.seek(0)
+    return buf
+
+
+# Small helper to use a variable as context
+@contextmanager
+def _managed_file(file: Any, **kwargs: Any) -> Iterator[Any]:
+    yield file
+
+
+def _prepare_stringio(file: StringIO, **kwargs: Any) -> BytesIO:
+    return _encode_stringio(file)
+
+
+def _prepare_bytesio(file: BytesIO, **kwargs: Any) -> BytesIO:
+    return file
+
+
+def _prepare_path(file: Path, **kwargs: Any) -> ContextManager[str]:
+    return _managed_file(str(file))
+
+
+def _prepare_str(file: str, **kwargs: Any) -> ContextManager[Union[str, BinaryIO]]:
+    if _WITH_FSSPEC:
+        if _protocol_of(file) == "file":
+            return _managed_file(file)
+        if _REMOTE_CACHE is not None:
+            return _open_remote_cached(file, _REMOTE_CACHE[0], **kwargs)
+        import fsspec
+
+        return fsspec.open(file, **kwargs)
+    if file.startswith("http"):
+        return _process_http_file(file)
+    return _managed_file(file)
+
+
+def _prepare_list(
+    file: List[Any], **kwargs: Any
+) -> ContextManager[Union[List[str], List[BinaryIO]]]:
+    if _WITH_FSSPEC and bool(file) and all(isinstance(f, str) for f in file):
+        if all(_protocol_of(f) == "file" for f in file):
+            return _managed_file(file)
+        if _REMOTE_CACHE is not None:
+            return _open_remote_cached(file, _REMOTE_CACHE[0], **kwargs)
+        import fsspec
+
+        return fsspec.open_files(file, **kwargs)
+    return _managed_file(file)
+
+
+# Handlers of `_prepare_file_arg`, by the type of the file argument.
+_PREPARE_FILE_ARG: Dict[type, Callable[..., ContextManager[Any]]] = {
+    StringIO: _prepare_stringio,
+    BytesIO: _prepare_bytesio,
+    Path: _prepare_path,
+    str: _prepare_str,
+    list: _prepare_list,
+    object: _managed_file,
+}
+
+
 @overload
 def _prepare_file_arg(
     file: Union[str, List[str], Path, BinaryIO, bytes], **kwargs: Any
@@ -95,43 +390,89 @@ def _prepare_file_arg(
 
     When fsspec is installed, remote file(s) is (are) opened with
     `fsspec.open(file, **kwargs)` or `fsspec.open_files(file, **kwargs)`.
+    If a remote cache is set with `set_remote_cache`, they are opened through
+    fsspec's `filecache` instead.
     """
 
-    # Small helper to use a variable as context
-    @contextmanager
-    def managed_file(file: Any) -> Iterator[Any]:
+    cls = type(file)
+    prepare = _PREPARE_FILE_ARG.get(cls)
+    if prepare is None:
+        # Subclasses use the handler of their closest base class (at least `object`).
+        prepare = next(
+            _PREPARE_FILE_ARG[base] for base in cls.__mro__ if base in _PREPARE_FILE_ARG
+        )
+        _PREPARE_FILE_ARG[cls] = prepare
+    return prepare(file, **kwargs)
+
+
+def _arrow_filesystem(source: str, storage_options: Dict) -> Optional[Tuple[Any, str]]:
+    """
+    Get a filesystem that pyarrow can read the remote ``source`` from, and the path
+    of ``source`` on it.
+
+    Without ``storage_options``, pyarrow's own filesystems (e.g. S3, GCS, HDFS) are
+    used. Otherwise, and for schemes pyarrow does not know, fsspec is used if it is
+    installed. Returns ``None`` if neither can open ``source``.
+    """
+    if not storage_options:
+        from pyarrow.fs import FileSystem
+
         try:
-            yield file
-        finally:
+            return FileSystem.from_uri(source)
+        except (pa.ArrowException, OSError):
             pass
+    if _WITH_FSSPEC:
+        from fsspec.core import url_to_fs
 
-    if isinstance(file, StringIO):
-        return BytesIO(file.read().encode("utf8"))
-    if isinstance(file, BytesIO):
-        return file
-    if isinstance(file, Path):
-        return managed_file(str(file))
-    if isinstance(file, str):
-        if _WITH_FSSPEC:
-            if infer_storage_options(file)["protocol"] == "file":
-                return managed_file(file)
-            return fsspec.open(file, **kwargs)
-        if file.startswith("http"):
-            return _process_http_file(file)
-    if isinstance(file, list) and bool(file) and all(isinstance(f, str) for f in file):
-        if _WITH_FSSPEC:
-            if all(infer_storage_options(f)["protocol"] == "file" for f in file):
-                return managed_file(file)
-            return fsspec.open_files(file, **kwargs)
-    return managed_file(file)
+        try:
+            return url_to_fs(source, **storage_options)
+        except (ImportError, ValueError):
+            # unknown protocol, or its implementation is not installed
+            pass
+    return None
+
+
+def _read_in_parallel(
+    read: Callable[[Any], T], sources: List[Any], max_workers: Optional[int] = None
+) -> List[T]:
+    """
+    Apply ``read`` to every source on a thread pool of at most ``max_workers``
+    threads (defaults to the number of cpus).
+
+    The readers release the GIL, so the sources are read in parallel.
+    """
+    max_workers = min(len(sources), max_workers or os.cpu_count() or 1)
+    if max_workers <= 1:
+        return [read(source) for source in sources]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(read, sources))
+
+
+@lru_cache(maxsize=128)
+def _remap_dtype_names(
+    new_columns: Tuple[str, ...],
+    current_columns: Tuple[str, ...],
+    names: Tuple[str, ...],
+) -> Tuple[str, ...]:
+    """
+    Map the ``new_columns`` names in ``names`` to their ``current_columns`` names.
+
+    Names that are not in ``new_columns`` are kept. The result is cached, as reading
+    many files with the same columns and dtypes maps the same names every time.
+    """
+    new_to_current = dict(zip(new_columns, current_columns))
+    return tuple(new_to_current.get(name, name) for name in names)
+
+
+# Dtypes that the csv parser reads directly. Other dtypes are read as the inferred
+# dtype and cast afterwards, so they need schema inference.
+_CSV_PARSED_DTYPES = {Int32, Int64, UInt32, UInt64, Float32, Float64, Utf8, Categorical}
 
 
 def update_columns(df: DataFrame, new_columns: List[str]) -> DataFrame:
     if df.width > len(new_columns):
-        cols = df.columns
-        for i, name in enumerate(new_columns):
-            cols[i] = name
-        new_columns = cols
+        df._rename_by_index(list(range(len(new_columns))), new_columns)
+        return df
     df.columns = new_columns
     return df
 
@@ -196,6 +537,10 @@ def read_csv(
         Start reading after ``skip_rows`` lines.
     dtypes
         Overwrite dtypes during inference.
+        If ``columns`` are selected by name and all of them are given one of
+        the dtypes ``pl.Int32``, ``pl.Int64``, ``pl.UInt32``, ``pl.UInt64``,
+        ``pl.Float32``, ``pl.Float64``, ``pl.Utf8`` or ``pl.Categorical``
+        here, schema inference is skipped.
     null_values
         Values to interpret as null values. You can provide a:
           - ``str``: All values equal to this string will be null.
@@ -212,6 +557,8 @@ def read_csv(
     n_threads
         Number of threads to use in csv parsing.
         Defaults to the number of physical cpu's of your system.
+        The input is split on line boundaries into one chunk per thread;
+        ``bytes`` input is parsed in place, without copying.
     infer_schema_length
         Maximum number of lines to read to infer schema.
         If set to 0, all columns will be read as ``pl.Utf8``.
@@ -238,6 +585,10 @@ def read_csv(
         this function determines if it is possible to use pyarrow's
         native parser. Note that pyarrow and polars may have a
         different strategy regarding type inference.
+        The parsed arrow data is imported through the Arrow C data interface.
+        Some types are converted on import (e.g. ``string`` to large utf8,
+        decimals to floats, timezone aware to naive datetimes), and with
+        ``rechunk`` the chunks pyarrow returns per parsed block are combined.
     storage_options
         Extra options that make sense for ``fsspec.open()`` or a
         particular storage connection.
@@ -286,28 +637,39 @@ def read_csv(
         and null_values is None
         and parse_dates
     ):
+        import pyarrow.csv as pa_csv
+
         include_columns = None
+        # Indices of the selected columns, if they are selected without a header.
+        column_indices: Optional[Sequence[int]] = None
 
         if columns:
             if not has_header:
                 # Convert 'column_1', 'column_2', ... column names to 'f0', 'f1', ... column names for pyarrow,
                 # if CSV file does not contain a header.
-                include_columns = [f"f{int(column[7:]) - 1}" for column in columns]
+                column_indices = [int(column[7:]) - 1 for column in columns]
             else:
                 include_columns = columns
 
         if not columns and projection:
             # Convert column indices from projection to 'f0', 'f1', ... column names for pyarrow.
-            include_columns = [f"f{column_idx}" for column_idx in projection]
+            column_indices = projection
+
+        if column_indices is not None:
+            include_columns = [f"f{column_idx}" for column_idx in column_indices]
 
         with _prepare_file_arg(file, **storage_options) as data:
-            tbl = pa.csv.read_csv(
+            if isinstance(data, bytes):
+                # pyarrow only reads bytes through a buffer, which wraps them without
+                # copying.
+                data = pa.BufferReader(data)
+            tbl = pa_csv.read_csv(
                 data,
-                pa.csv.ReadOptions(
+                pa_csv.ReadOptions(
                     skip_rows=skip_rows, autogenerate_column_names=not has_header
                 ),
-                pa.csv.ParseOptions(delimiter=sep),
-                pa.csv.ConvertOptions(
+                pa_csv.ParseOptions(delimiter=sep),
+                pa_csv.ConvertOptions(
                     column_types=None,
                     include_columns=include_columns,
                     include_missing_columns=ignore_errors,
@@ -316,8 +678,12 @@ def read_csv(
 
         if not has_header:
             # Rename 'f0', 'f1', ... columns names autogenated by pyarrow to 'column_1', 'column_2', ...
+            # The selected columns are returned in the order they were selected, so the
+            # names follow from the indices without parsing them back.
+            if column_indices is None:
+                column_indices = range(tbl.num_columns)
             tbl = tbl.rename_columns(
-                [f"column_{int(column[1:]) + 1}" for column in tbl.column_names]
+                [f"column_{column_idx + 1}" for column_idx in column_indices]
             )
 
         df = from_arrow(tbl, rechunk)
@@ -373,15 +739,21 @@ def read_csv(
                     dtypes = dtype_list
 
         if current_columns and isinstance(dtypes, dict):
-            new_to_current = {
-                new_column: current_column
-                for new_column, current_column in zip(new_columns, current_columns)
-            }
-            # Change new column names to current column names in dtype.
-            dtypes = {
-                new_to_current.get(column_name, column_name): column_dtype
-                for column_name, column_dtype in dtypes.items()
-            }
+            # Change new column names to current column names in dtype. Only the
+            # names are remapped; the dtypes are zipped back in unchanged.
+            current_names = _remap_dtype_names(
+                tuple(new_columns), tuple(current_columns), tuple(dtypes)
+            )
+            dtypes = dict(zip(current_names, dtypes.values()))
+
+    if (
+        columns
+        and isinstance(dtypes, dict)
+        and all(dtypes.get(column) in _CSV_PARSED_DTYPES for column in columns)
+    ):
+        # All selected columns are parsed with the given dtypes, so inferring the
+        # schema would only scan rows for nothing.
+        infer_schema_length = 0
 
     with _prepare_file_arg(file, **storage_options) as data:
         df = DataFrame._read_csv(
@@ -410,6 +782,46 @@ def read_csv(
     return df
 
 
+def read_csv_many(
+    files: Sequence[Union[str, Path]],
+    max_workers: Optional[int] = None,
+    **kwargs: Any,
+) -> List[DataFrame]:
+    """
+    Read multiple CSV files into a list of DataFrames.
+
+    The files are read concurrently. Unless ``n_threads`` is given, every file is
+    parsed on the global thread pool, so concurrent reads share its threads instead
+    of each creating a pool of their own.
+
+    Parameters
+    ----------
+    files
+        Paths of the CSV files.
+    max_workers
+        Maximum number of files that are read at the same time.
+        Defaults to the number of cpu's of your system.
+    **kwargs
+        Keyword arguments for ``read_csv``, used for every file. Passing
+        ``n_threads`` here creates a thread pool with that many threads for every
+        file that is not small enough to be parsed by a single thread.
+
+    Returns
+    -------
+    List of DataFrames, in the order of ``files``.
+
+    Examples
+    --------
+
+    >>> dfs = pl.read_csv_many(
+    ...     ["a.csv", "b.csv"], dtypes={"x": pl.Float64}
+    ... )  # doctest: +SKIP
+    >>> df = pl.concat(dfs)  # doctest: +SKIP
+
+    """
+    return _read_in_parallel(partial(read_csv, **kwargs), list(files), max_workers)
+
+
 def scan_csv(
     file: Union[str, Path],
     has_header: bool = True,
@@ -642,7 +1054,7 @@ def read_ipc_schema(
 
 
 def read_ipc(
-    file: Union[str, BinaryIO, BytesIO, Path, bytes],
+    file: Union[str, List[str], BinaryIO, BytesIO, Path, bytes],
     columns: Optional[Union[List[int], List[str]]] = None,
     n_rows: Optional[int] = None,
     use_pyarrow: bool = _PYARROW_AVAILABLE,
@@ -656,7 +1068,8 @@ def read_ipc(
     Parameters
     ----------
     file
-        Path to a file or a file like object.
+        Path to a file, list of files, or a file like object.
+        Multiple files are read in parallel and concatenated.
         If ``fsspec`` is installed, it will be used to open remote files.
     columns
         Columns to select. Accepts a list of column indices (starting at zero) or a list of column names.
@@ -693,10 +1106,35 @@ def read_ipc(
                 raise ImportError(
                     "'pyarrow' is required when using 'read_ipc(..., use_pyarrow=True)'."
                 )
-
-            tbl = pa.feather.read_table(data, memory_map=memory_map, columns=columns)
+            import pyarrow.feather as pa_feather
+
+            if isinstance(data, list):
+                tbl = pa.concat_tables(
+                    _read_in_parallel(
+                        partial(
+                            pa_feather.read_table,
+                            memory_map=memory_map,
+                            columns=columns,
+                        ),
+                        data,
+                    )
+                )
+            else:
+                tbl = pa_feather.read_table(
+                    data, memory_map=memory_map, columns=columns
+                )
             return DataFrame._from_arrow(tbl)
 
+        if isinstance(data, list):
+            df = concat(
+                _read_in_parallel(
+                    partial(DataFrame._read_ipc, columns=columns, n_rows=n_rows),
+                    data,
+                ),
+                rechunk=False,
+            )
+            return df if n_rows is None else df.head(n_rows)
+
         return DataFrame._read_ipc(
             data,
             columns=columns,
@@ -712,6 +1150,7 @@ def read_parquet(
     memory_map: bool = True,
     storage_options: Optional[Dict] = None,
     parallel: bool = True,
+    predicate: Optional["pa.compute.Expression"] = None,
     **kwargs: Any,
 ) -> DataFrame:
     """
@@ -722,6 +1161,7 @@ def read_parquet(
     source
         Path to a file, list of files, or a file like object. If the path is a directory, that directory will be used
         as partition aware scan.
+        With the native reader, multiple files are read in parallel and concatenated.
         If ``fsspec`` is installed, it will be used to open remote files.
     columns
         Columns to select. Accepts a list of column indices (starting at zero) or a list of column names.
@@ -737,12 +1177,31 @@ def read_parquet(
         Extra options that make sense for ``fsspec.open()`` or a particular storage connection, e.g. host, port, username, password, etc.
     parallel
         Read the parquet file in parallel. The single threaded reader consumes less memory.
+    predicate
+        Only read the rows that match this pyarrow expression, e.g.
+        ``pyarrow.compute.field("a") > 10``. Row groups whose statistics rule out any
+        match are skipped without being read.
+        Only valid when ``use_pyarrow=True``; with the native reader, use
+        ``scan_parquet(...).filter(...)`` to push a predicate down to the scan.
     **kwargs
         kwargs for [pyarrow.parquet.read_table](https://arrow.apache.org/docs/python/generated/pyarrow.parquet.read_table.html)
 
     Returns
     -------
     DataFrame
+
+    Examples
+    --------
+    The native reader releases the GIL while reading, so multiple files can be read
+    concurrently from a thread pool:
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> files = [f"partition_{i}.parquet" for i in range(32)]
+    >>> with ThreadPoolExecutor() as pool:
+    ...     dfs = list(pool.map(pl.read_parquet, files))  # doctest: +SKIP
+    ...
+    >>> df = pl.concat(dfs)  # doctest: +SKIP
+
     """
 
     # Map legacy arguments to current ones and remove them from kwargs.
@@ -752,19 +1211,42 @@ def read_parquet(
         columns = kwargs.pop("projection", None)
 
     if use_pyarrow:
+        if not _PYARROW_AVAILABLE:
+            raise ImportError(
+                "'pyarrow' is required when using 'read_parquet(..., use_pyarrow=True)'."
+            )
+        import pyarrow.parquet as pa_parquet
+
         if n_rows:
             raise ValueError("``n_rows`` cannot be used with ``use_pyarrow=True``.")
+        if predicate is not None:
+            kwargs["filters"] = predicate
+    elif predicate is not None:
+        raise ValueError(
+            "``predicate`` can only be used with ``use_pyarrow=True``. "
+            "Use ``scan_parquet(...).filter(...)`` with the native reader."
+        )
 
     storage_options = storage_options or {}
+    if (
+        use_pyarrow
+        and isinstance(source, str)
+        and _URL_SCHEME.match(source) is not None
+        and _REMOTE_CACHE is None
+    ):
+        # Let pyarrow read remote files through a filesystem, so it only fetches the
+        # row groups and columns it needs instead of the whole file.
+        fs_path = _arrow_filesystem(source, storage_options)
+        if fs_path is not None:
+            fs, path = fs_path
+            return from_arrow(  # type: ignore[return-value]
+                pa_parquet.read_table(path, filesystem=fs, columns=columns, **kwargs)
+            )
+
     with _prepare_file_arg(source, **storage_options) as source_prep:
         if use_pyarrow:
-            if not _PYARROW_AVAILABLE:
-                raise ImportError(
-                    "'pyarrow' is required when using 'read_parquet(..., use_pyarrow=True)'."
-                )
-
             return from_arrow(  # type: ignore[return-value]
-                pa.parquet.read_table(
+                pa_parquet.read_table(
                     source_prep,
                     memory_map=memory_map,
                     columns=columns,
@@ -772,6 +1254,21 @@ def read_parquet(
                 )
             )
 
+        if isinstance(source_prep, list):
+            df = concat(
+                _read_in_parallel(
+                    partial(
+                        DataFrame._read_parquet,
+                        columns=columns,
+                        n_rows=n_rows,
+                        parallel=parallel,
+                    ),
+                    source_prep,
+                ),
+                rechunk=False,
+            )
+            return df if n_rows is None else df.head(n_rows)
+
         return DataFrame._read_parquet(
             source_prep, columns=columns, n_rows=n_rows, parallel=parallel
         )
@@ -863,6 +1360,8 @@ def read_sql(
 
     """
     if _WITH_CX:
+        import connectorx as cx
+
         tbl = cx.read_sql(
             conn=connection_uri,
             query=sql,
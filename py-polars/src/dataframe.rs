@@ -142,7 +142,7 @@ impl PyDataFrame {
         });
 
         let mmap_bytes_r = get_mmap_bytes_reader(py_f)?;
-        let df = CsvReader::new(mmap_bytes_r)
+        let reader = CsvReader::new(mmap_bytes_r)
             .infer_schema(infer_schema_length)
             .has_header(has_header)
             .with_n_rows(n_rows)
@@ -162,8 +162,12 @@ impl PyDataFrame {
             .with_comment_char(comment_char)
             .with_null_values(null_values)
             .with_parse_dates(parse_dates)
-            .with_quote_char(quote_char)
-            .finish()
+            .with_quote_char(quote_char);
+        // Release the GIL while parsing, so other python threads can run.
+        // Python file objects reacquire it when they are read from.
+        let df = py_f
+            .py()
+            .allow_threads(move || reader.finish())
             .map_err(PyPolarsEr::from)?;
         Ok(df.into())
     }
@@ -171,6 +175,7 @@ impl PyDataFrame {
     #[staticmethod]
     #[cfg(feature = "parquet")]
     pub fn read_parquet(
+        py: Python,
         py_f: PyObject,
         columns: Option<Vec<String>>,
         projection: Option<Vec<usize>>,
@@ -182,19 +187,23 @@ impl PyDataFrame {
         let result = match get_either_file(py_f, false)? {
             Py(f) => {
                 let buf = f.as_buffer();
-                ParquetReader::new(buf)
+                py.allow_threads(move || {
+                    ParquetReader::new(buf)
+                        .with_projection(projection)
+                        .with_columns(columns)
+                        .read_parallel(parallel)
+                        .with_n_rows(n_rows)
+                        .finish()
+                })
+            }
+            Rust(f) => py.allow_threads(move || {
+                ParquetReader::new(f)
                     .with_projection(projection)
                     .with_columns(columns)
                     .read_parallel(parallel)
                     .with_n_rows(n_rows)
                     .finish()
-            }
-            Rust(f) => ParquetReader::new(f)
-                .with_projection(projection)
-                .with_columns(columns)
-                .read_parallel(parallel)
-                .with_n_rows(n_rows)
-                .finish(),
+            }),
         };
         let df = result.map_err(PyPolarsEr::from)?;
         Ok(PyDataFrame::new(df))
@@ -203,17 +212,21 @@ impl PyDataFrame {
     #[staticmethod]
     #[cfg(feature = "ipc")]
     pub fn read_ipc(
+        py: Python,
         py_f: PyObject,
         columns: Option<Vec<String>>,
         projection: Option<Vec<usize>>,
         n_rows: Option<usize>,
     ) -> PyResult<Self> {
         let file = get_file_like(py_f, false)?;
-        let df = IpcReader::new(file)
-            .with_projection(projection)
-            .with_columns(columns)
-            .with_n_rows(n_rows)
-            .finish()
+        let df = py
+            .allow_threads(move || {
+                IpcReader::new(file)
+                    .with_projection(projection)
+                    .with_columns(columns)
+                    .with_n_rows(n_rows)
+                    .finish()
+            })
             .map_err(PyPolarsEr::from)?;
         Ok(PyDataFrame::new(df))
     }
@@ -515,6 +528,21 @@ impl PyDataFrame {
         Ok(())
     }
 
+    /// Rename the columns at `positions` to `names` and keep the other names.
+    pub fn rename_by_index(&mut self, positions: Vec<usize>, names: Vec<&str>) -> PyResult<()> {
+        let mut column_names = self.df.get_column_names_owned();
+        for (idx, name) in positions.into_iter().zip(names) {
+            let column_name = column_names.get_mut(idx).ok_or_else(|| {
+                PyPolarsEr::Other(format!("column index {} is out of bounds", idx))
+            })?;
+            *column_name = name.to_string();
+        }
+        self.df
+            .set_column_names(&column_names)
+            .map_err(PyPolarsEr::from)?;
+        Ok(())
+    }
+
     pub fn with_column(&mut self, s: PySeries) -> PyResult<Self> {
         let mut df = self.df.clone();
         df.with_column(s.series).map_err(PyPolarsEr::from)?;
@@ -8,7 +8,7 @@ import zlib
 from datetime import date
 from functools import partial
 from pathlib import Path
-from typing import Dict, List, Type, Union
+from typing import Any, Dict, List, Optional, Type, Union
 
 import numpy as np
 import pandas as pd
@@ -87,6 +87,186 @@ def test_read_web_file() -> None:
     assert df.shape == (27, 4)
 
 
+class _FakeHTTPResponse(io.BytesIO):
+    def __init__(self, data: bytes, status: int = 200, headers: Optional[Dict] = None):
+        super().__init__(data)
+        self.status = status
+        self.headers = headers or {}
+
+
+def test_process_http_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = b"a,b\n" + b"1,2\n" * 1000
+    requested_ranges = []
+    accept_ranges = "none"
+    range_status = 206
+
+    def urlopen(request: Any) -> _FakeHTTPResponse:
+        if isinstance(request, str):
+            return _FakeHTTPResponse(data)
+        if request.get_method() == "HEAD":
+            headers = {"Accept-Ranges": accept_ranges, "Content-Length": len(data)}
+            return _FakeHTTPResponse(b"", headers=headers)
+        start, end = request.get_header("Range")[len("bytes=") :].split("-")
+        requested_ranges.append((int(start), int(end)))
+        if range_status != 206:
+            return _FakeHTTPResponse(data, status=range_status)
+        return _FakeHTTPResponse(data[int(start) : int(end) + 1], status=206)
+
+    monkeypatch.setattr(pl.io, "urlopen", urlopen)
+    monkeypatch.setattr(pl.io, "_HTTP_BLOCK_SIZE", 64)
+
+    f = pl.io._process_http_file("https://example.com/file.csv")
+    assert f.read() == data
+    assert requested_ranges == []
+
+    accept_ranges = "bytes"
+    f = pl.io._process_http_file("https://example.com/file.csv")
+    assert f.read() == data
+    assert len(requested_ranges) == pl.io._HTTP_MAX_RANGE_REQUESTS
+    assert requested_ranges[0][0] == 0
+    assert max(end for _, end in requested_ranges) == len(data) - 1
+
+    # a server that answers range requests with the full file is read at once
+    range_status = 200
+    f = pl.io._process_http_file("https://example.com/file.csv")
+    assert f.read() == data
+
+
+def test_remote_cache() -> None:
+    import tempfile
+
+    fsspec = pytest.importorskip("fsspec")
+
+    url = "memory://polars/test_remote_cache.csv"
+    with fsspec.open(url, "wb") as f:
+        f.write(b"a,b\n1,2\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir_name:
+        unrelated = os.path.join(tmpdir_name, "unrelated.txt")
+        with open(unrelated, "wb") as f:
+            f.write(b"not cached by polars")
+
+        try:
+            pl.set_remote_cache(tmpdir_name)
+            with pl.io._prepare_file_arg(url) as f:
+                assert f.read() == b"a,b\n1,2\n"  # type: ignore[union-attr]
+
+            # the second read is served from the local copy
+            with fsspec.open(url, "wb") as f:
+                f.write(b"a,b\n3,4\n")
+            with pl.io._prepare_file_arg(url) as f:
+                assert f.read() == b"a,b\n1,2\n"  # type: ignore[union-attr]
+
+            # shrinking the cache evicts the local copy
+            pl.set_remote_cache(tmpdir_name, max_bytes=0)
+            with pl.io._prepare_file_arg(url) as f:
+                assert f.read() == b"a,b\n3,4\n"  # type: ignore[union-attr]
+            assert os.listdir(os.path.join(tmpdir_name, "polars-filecache")) == [
+                "cache"
+            ]
+            # files outside of the polars subdirectory are never evicted
+            assert os.path.exists(unrelated)
+        finally:
+            pl.set_remote_cache(None)
+
+
+def test_remote_cache_evicts_least_recently_used() -> None:
+    import tempfile
+
+    fsspec = pytest.importorskip("fsspec")
+
+    urls = [f"memory://polars/test_remote_cache_lru_{i}.csv" for i in range(2)]
+    for url in urls:
+        with fsspec.open(url, "wb") as f:
+            f.write(b"a,b\n1,2\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir_name:
+        cache_dir = os.path.join(tmpdir_name, "polars-filecache")
+        try:
+            pl.set_remote_cache(tmpdir_name)
+            for url in urls:
+                with pl.io._prepare_file_arg(url):
+                    pass
+            cached = [name for name in os.listdir(cache_dir) if name != "cache"]
+            assert len(cached) == 2
+            for name in cached:
+                os.utime(os.path.join(cache_dir, name), (0, 0))
+
+            # reading the first url again marks its local copy as recently used
+            with pl.io._prepare_file_arg(urls[0]) as f:
+                recent = os.path.basename(f.name)  # type: ignore[union-attr]
+
+            file_size = os.path.getsize(os.path.join(cache_dir, recent))
+            pl.set_remote_cache(tmpdir_name, max_bytes=file_size)
+            assert [name for name in os.listdir(cache_dir) if name != "cache"] == [
+                recent
+            ]
+        finally:
+            pl.set_remote_cache(None)
+
+
+def test_encode_stringio(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pl.io, "_ENCODE_CHUNK_SIZE", 3)
+    text = "a,b\nä,ö\n€,ü\n"
+    with pl.io._prepare_file_arg(io.StringIO(text)) as f:
+        assert f.read() == text.encode("utf8")  # type: ignore[union-attr]
+
+
+def test_remap_dtype_names() -> None:
+    names = pl.io._remap_dtype_names(
+        ("a", "b", "c"), ("column_1", "column_2", "column_3"), ("c", "x", "a")
+    )
+    assert names == ("column_3", "x", "column_1")
+
+
+def test_prepare_file_arg_dispatch() -> None:
+    class MyBytesIO(io.BytesIO):
+        pass
+
+    with pl.io._prepare_file_arg(Path("a.csv")) as f:
+        assert f == "a.csv"
+    with pl.io._prepare_file_arg(io.StringIO("a,b")) as f:
+        assert f.read() == b"a,b"  # type: ignore[union-attr]
+    buf = MyBytesIO(b"a,b")
+    with pl.io._prepare_file_arg(buf) as f:
+        assert f is buf
+    with pl.io._prepare_file_arg(b"a,b") as f:
+        assert f == b"a,b"
+
+
+def test_arrow_filesystem() -> None:
+    fsspec = pytest.importorskip("fsspec")
+
+    url = "memory://polars/test_arrow_filesystem.parquet"
+    fs_path = pl.io._arrow_filesystem(url, {})
+    assert fs_path is not None
+    fs, path = fs_path
+    assert isinstance(fs, fsspec.implementations.memory.MemoryFileSystem)
+    assert path == "/polars/test_arrow_filesystem.parquet"
+    assert pl.io._arrow_filesystem("unknown://polars/file.parquet", {}) is None
+
+    df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    with fsspec.open(url, "wb") as f:
+        df.to_parquet(f, use_pyarrow=True)
+    read = pl.read_parquet(url, columns=["a"], use_pyarrow=True)
+    assert read.frame_equal(df[["a"]])
+
+
+def test_protocol_of() -> None:
+    fsspec_utils = pytest.importorskip("fsspec.utils")
+
+    for file in [
+        "foods.csv",
+        "/data/foods.csv",
+        "C:\\data\\foods.csv",
+        "file:///data/foods.csv",
+        "s3://bucket/foods.csv",
+        "https://example.com/foods.csv",
+    ]:
+        expected = fsspec_utils.infer_storage_options(file)["protocol"]
+        assert pl.io._protocol_of(file) == expected
+
+
 def test_parquet_chunks() -> None:
     """
     This failed in https://github.com/pola-rs/polars/issues/545
@@ -113,6 +293,59 @@ def test_parquet_chunks() -> None:
         assert pl.DataFrame(df).frame_equal(polars_df)
 
 
+def test_read_multiple_files() -> None:
+    import tempfile
+
+    df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    expected = pl.concat([df, df, df])
+
+    with tempfile.TemporaryDirectory() as tmpdir_name:
+        for to_fn, from_fn, ext in zip(
+            ["to_parquet", "to_ipc"], [pl.read_parquet, pl.read_ipc], ["parquet", "ipc"]
+        ):
+            files = [os.path.join(tmpdir_name, f"{i}.{ext}") for i in range(3)]
+            for file in files:
+                getattr(df, to_fn)(file)
+
+            for use_pyarrow in [True, False]:
+                read = from_fn(files, use_pyarrow=use_pyarrow)  # type: ignore
+                assert read.frame_equal(expected)
+
+            read = from_fn(files, n_rows=4, use_pyarrow=False)  # type: ignore
+            assert read.frame_equal(expected.head(4))
+
+
+def test_read_csv_many() -> None:
+    import tempfile
+
+    dfs = [pl.DataFrame({"a": [i, i + 1], "b": ["x", "y"]}) for i in range(4)]
+
+    with tempfile.TemporaryDirectory() as tmpdir_name:
+        files = [os.path.join(tmpdir_name, f"{i}.csv") for i in range(len(dfs))]
+        for df, file in zip(dfs, files):
+            df.to_csv(file)
+
+        read = pl.read_csv_many(files, max_workers=2, dtypes={"a": pl.Float64})
+        assert len(read) == len(dfs)
+        for df, read_df in zip(dfs, read):
+            assert read_df.frame_equal(df.with_column(pl.col("a").cast(pl.Float64)))
+
+
+def test_read_parquet_predicate() -> None:
+    import pyarrow.compute as pc
+
+    df = pl.DataFrame({"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]})
+    f = io.BytesIO()
+    df.to_parquet(f, use_pyarrow=True, row_group_size=2)
+    f.seek(0)
+
+    read = pl.read_parquet(f, use_pyarrow=True, predicate=pc.field("a") > 2)
+    assert read.frame_equal(df[2:])
+
+    with pytest.raises(ValueError):
+        pl.read_parquet(f, predicate=pc.field("a") > 2)
+
+
 def test_parquet_datetime() -> None:
     """
     This failed because parquet writers cast datetime to Date
@@ -428,6 +661,28 @@ def test_ignore_parse_dates() -> None:
     assert df.dtypes == [pl.Utf8, pl.Utf8, pl.Utf8]
 
 
+def test_csv_dtypes_skip_inference() -> None:
+    csv = b"a,b,c\n1,x,2021-01-01\n2,y,2021-01-02\n"
+    df = pl.read_csv(csv, columns=["a", "b"], dtypes={"a": pl.Float64, "b": pl.Utf8})
+    assert df.dtypes == [pl.Float64, pl.Utf8]
+    assert df["a"].to_list() == [1.0, 2.0]
+
+    # dtypes that are cast after parsing still use the inferred schema
+    df = pl.read_csv(csv, columns=["a"], dtypes={"a": pl.Int16})
+    assert df.dtypes == [pl.Int16]
+
+
+def test_csv_skip_rows_pyarrow() -> None:
+    csv = """# generated file
+a,b
+1,foo
+2,bar""".encode()
+
+    expected = pl.read_csv(csv, skip_rows=1)
+    df = pl.read_csv(csv, skip_rows=1, use_pyarrow=True, parse_dates=True)
+    assert df.frame_equal(expected)
+
+
 def test_scan_csv() -> None:
     df = pl.scan_csv(Path(__file__).parent / "files" / "small.csv")
     assert df.collect().shape == (4, 3)